@@ -1,7 +1,10 @@
+import asyncio
 import ctypes
 import sys
 import os
+import copy
 import datetime
+import json
 import re
 
 import camelot
@@ -16,8 +19,10 @@ from docx.enum.section import WD_ORIENTATION
 from docx.shared import Pt, RGBColor, Inches
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
 
 from PyQt5.QtCore import QTimer, QThread, pyqtSignal, Qt
 from PyQt5.QtWidgets import (
@@ -51,6 +56,267 @@ sys.excepthook = global_excepthook
 data = datetime.date.today().strftime("%d_%m_%Y")
 data1 = datetime.date.today().strftime("%d/%m/%Y")
 
+# -----------------------
+# Layouts
+# -----------------------
+# Arquivo opcional que sobrescreve o layout padrão (chaves ausentes usam o padrão).
+# Em "template" pode-se indicar um .xlsx/.docx cujo estilo será usado como base.
+LAYOUT_CONFIG_PATH = "layouts.json"
+
+LAYOUT_PADRAO = {
+    "excel": {
+        "titulo": "REUNIÃO DE LÍDERES - {data}",
+        "nome_arquivo": "{data} - REUNIÃO DE LÍDERES.xlsx",
+        "colunas": [
+            '  ', 'Proposição', 'Autoria', 'Regime', 'Descrição',
+            'Relator', 'Solicitações de Pauta', 'Assessor', 'Orientação', 'Observações'
+        ],
+        "fonte": "Arial",
+        "tamanho_fonte": 14,
+        "cor_destaque": "D3D3D3",
+        "larguras": {"A": 5, "E": 70},
+        "largura_ultimas": 18,
+        "qtd_ultimas": 9,
+        "largura_maxima": 80,
+        "altura_titulo": 30,
+        "template": None,
+    },
+    "word": {
+        "titulo": "PAUTA DE PLENÁRIO - {data}",
+        "nome_arquivo": "{data} - Pauta plenário.docx",
+        "cabecalhos": ["Projeto", "Análise"],
+        "texto_complementa": "Autoria: \nRelatoria: \nAssessoria Oposição: \nMinoria: \nPOSICIONAMENTO:",
+        "fonte": "Arial",
+        "tamanho_titulo": 13,
+        "cor_titulo": "0000FF",
+        "tamanho_cabecalho": 13,
+        "cor_cabecalho": "D3D3D3",
+        "tamanho_texto": 10,
+        "template": None,
+    },
+}
+
+
+class LayoutError(ValueError):
+    """ Erro na configuração de layout, com mensagem pronta para o usuário."""
+
+
+def _cor_hex(valor, chave):
+    # Aceita "D3D3D3" ou "#D3D3D3"
+    cor = str(valor).lstrip("#")
+    if not re.fullmatch(r"[0-9A-Fa-f]{6}", cor):
+        raise LayoutError(f'"{chave}" deve ser uma cor no formato RRGGBB (ex.: "D3D3D3"), recebido: {valor!r}')
+    return cor.upper()
+
+
+def _texto_com_data(valor, chave):
+    # Títulos e nomes de arquivo só podem usar o campo {data}
+    try:
+        str(valor).format(data=data)
+    except (KeyError, IndexError, ValueError) as e:
+        raise LayoutError(f'"{chave}" só pode usar o campo {{data}}, recebido: {valor!r} ({e})')
+    return str(valor)
+
+
+def _lista_textos(valor, chave):
+    if not isinstance(valor, list) or not valor or not all(isinstance(v, str) for v in valor):
+        raise LayoutError(f'"{chave}" deve ser uma lista não vazia de textos, recebido: {valor!r}')
+    return list(valor)
+
+
+class LayoutExcel:
+    """ Estilos do Excel compilados uma única vez e reutilizados em todos os trabalhos."""
+
+    ESTILO_CABECALHO = "pauta_cabecalho"
+    ESTILO_CORPO = "pauta_corpo"
+    ESTILO_PRIMEIRA_COLUNA = "pauta_primeira_coluna"
+
+    def __init__(self, config, base_dir):
+        self.titulo = _texto_com_data(config["titulo"], "titulo")
+        self.nome_arquivo = _texto_com_data(config["nome_arquivo"], "nome_arquivo")
+        self.colunas = _lista_textos(config["colunas"], "colunas")
+        self.larguras = dict(config["larguras"])
+        self.largura_ultimas = config["largura_ultimas"]
+        self.qtd_ultimas = config["qtd_ultimas"]
+        self.largura_maxima = config["largura_maxima"]
+        self.altura_titulo = config["altura_titulo"]
+
+        cor = _cor_hex(config["cor_destaque"], "cor_destaque")
+        self.fonte_cabecalho = Font(name=config["fonte"], size=config["tamanho_fonte"], bold=True)
+        self.fonte_corpo = Font(name=config["fonte"], size=config["tamanho_fonte"])
+        self.preenchimento = PatternFill(start_color=cor, end_color=cor, fill_type="solid")
+        self.alinhamento_cabecalho = Alignment(wrapText=True, horizontal='center', vertical='center')
+        self.alinhamento_corpo = Alignment(wrapText=True, horizontal='left', vertical='top')
+
+        # O .xlsx do template é lido uma vez; cada trabalho preenche uma cópia em memória
+        self.template_bytes = None
+        if config["template"]:
+            with open(os.path.join(base_dir, config["template"]), "rb") as f:
+                self.template_bytes = f.read()
+            self._aplicar_template()
+
+    def _aplicar_template(self):
+        # A2 define o estilo do cabeçalho, A3 o do corpo; larguras e altura vêm da planilha
+        sheet = openpyxl.load_workbook(BytesIO(self.template_bytes)).active
+        cabecalho, corpo = sheet["A2"], sheet["A3"]
+        if cabecalho.has_style:
+            self.fonte_cabecalho = copy.copy(cabecalho.font)
+            self.preenchimento = copy.copy(cabecalho.fill)
+            self.alinhamento_cabecalho = copy.copy(cabecalho.alignment)
+        if corpo.has_style:
+            self.fonte_corpo = copy.copy(corpo.font)
+            self.alinhamento_corpo = copy.copy(corpo.alignment)
+        for col_letter, dimension in sheet.column_dimensions.items():
+            if dimension.width:
+                self.larguras[col_letter] = dimension.width
+        if sheet.row_dimensions[1].height:
+            self.altura_titulo = sheet.row_dimensions[1].height
+
+    def novo_workbook(self):
+        """
+        Retorna (workbook, sheet) prontos para preencher, com os estilos nomeados registrados.
+        """
+        if self.template_bytes is not None:
+            # Mantém configuração de página, outras abas e o nome da aba; só o conteúdo
+            # de exemplo sai (mesclagens antigas sobreporiam a do título e corrompem o arquivo)
+            workbook = openpyxl.load_workbook(BytesIO(self.template_bytes))
+            sheet = workbook.active
+            for merged in list(sheet.merged_cells.ranges):
+                sheet.unmerge_cells(str(merged))
+            if sheet.max_row:
+                sheet.delete_rows(1, sheet.max_row)
+        else:
+            workbook = openpyxl.Workbook()
+            sheet = workbook.active
+            sheet.title = "Tabelas"
+
+        estilos = {
+            self.ESTILO_CABECALHO: (self.fonte_cabecalho, self.preenchimento, self.alinhamento_cabecalho),
+            self.ESTILO_CORPO: (self.fonte_corpo, PatternFill(), self.alinhamento_corpo),
+            self.ESTILO_PRIMEIRA_COLUNA: (self.fonte_corpo, self.preenchimento, self.alinhamento_corpo),
+        }
+        for nome, (fonte, preenchimento, alinhamento) in estilos.items():
+            if nome not in workbook.named_styles:
+                workbook.add_named_style(
+                    NamedStyle(name=nome, font=fonte, fill=preenchimento, alignment=alinhamento)
+                )
+        return workbook, sheet
+
+
+class LayoutWord:
+    """ Estilos do Word compilados uma única vez e reutilizados em todos os trabalhos."""
+
+    ESTILO_TABELA = "Table Grid"
+
+    def __init__(self, config, base_dir):
+        self.titulo = _texto_com_data(config["titulo"], "titulo")
+        self.nome_arquivo = _texto_com_data(config["nome_arquivo"], "nome_arquivo")
+        self.cabecalhos = _lista_textos(config["cabecalhos"], "cabecalhos")
+        self.texto_complementa = config["texto_complementa"]
+        self.fonte = config["fonte"]
+        self.tamanho_titulo = Pt(config["tamanho_titulo"])
+        self.cor_titulo = RGBColor.from_string(_cor_hex(config["cor_titulo"], "cor_titulo"))
+        self.tamanho_cabecalho = Pt(config["tamanho_cabecalho"])
+        self.cor_cabecalho = _cor_hex(config["cor_cabecalho"], "cor_cabecalho")
+        self.tamanho_texto = Pt(config["tamanho_texto"])
+
+        # O .docx do template é lido uma vez; cada trabalho abre uma cópia em memória
+        self.template_bytes = None
+        if config["template"]:
+            with open(os.path.join(base_dir, config["template"]), "rb") as f:
+                self.template_bytes = f.read()
+
+        # Documentos criados no Word só trazem os estilos que usam; sem "Table Grid"
+        # as bordas da tabela são desenhadas diretamente
+        self.usar_estilo_tabela = self.ESTILO_TABELA in self.novo_documento().styles
+
+    def novo_documento(self):
+        if self.template_bytes is None:
+            return Document()
+        # Remove o conteúdo de exemplo do corpo; seções, cabeçalho e estilos são mantidos
+        doc = Document(BytesIO(self.template_bytes))
+        body = doc.element.body
+        for elemento in list(body):
+            if elemento.tag != qn("w:sectPr"):
+                body.remove(elemento)
+        return doc
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _ler_config(config_path, mtime):
+    # mtime faz parte da chave: editar o arquivo invalida o cache sem reiniciar o app.
+    # Erros também ficam no cache, para o arquivo inválido não ser relido a cada trabalho.
+    config = copy.deepcopy(LAYOUT_PADRAO)
+    if mtime is None:
+        return config
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            usuario = json.load(f)
+    except (OSError, ValueError) as e:
+        return LayoutError(f"Não foi possível ler {config_path}: {e}")
+    if not isinstance(usuario, dict):
+        return LayoutError(f'{config_path} deve conter um objeto com as seções "excel" e/ou "word"')
+
+    for tipo, valores in usuario.items():
+        if tipo not in config:
+            continue
+        if not isinstance(valores, dict):
+            # Só o tipo afetado falha; o outro continua usando o próprio layout
+            config[tipo] = LayoutError(f'A seção "{tipo}" de {config_path} deve ser um objeto, recebido: {valores!r}')
+            continue
+        for chave, valor in valores.items():
+            # Dicionários (ex.: "larguras") são mesclados, não substituídos
+            if isinstance(valor, dict) and isinstance(config[tipo].get(chave), dict):
+                config[tipo][chave].update(valor)
+            else:
+                config[tipo][chave] = valor
+    return config
+
+
+@lru_cache(maxsize=8)
+def _compilar_layout(config_path, config_mtime, tipo, template_mtime):
+    # Cada tipo é compilado separadamente: um erro no layout do Word não afeta o Excel
+    config = _ler_config(config_path, config_mtime)
+    base_dir = os.path.dirname(os.path.abspath(config_path))
+    classe = LayoutExcel if tipo == "excel" else LayoutWord
+    try:
+        return classe(config[tipo], base_dir)
+    except LayoutError as e:
+        return LayoutError(f"Layout '{tipo}' inválido em {config_path}: {e}")
+    except Exception as e:
+        return LayoutError(f"Layout '{tipo}' inválido em {config_path}: {type(e).__name__}: {e}")
+
+
+def carregar_layout(tipo, config_path=LAYOUT_CONFIG_PATH):
+    """
+    Retorna o layout compilado ('excel' ou 'word'), usando o cache entre trabalhos.
+    Lança LayoutError se o layouts.json ou o template forem inválidos.
+    """
+    config_mtime = _mtime(config_path)
+    config = _ler_config(config_path, config_mtime)
+    if isinstance(config, LayoutError):
+        raise LayoutError(str(config))
+    if isinstance(config[tipo], LayoutError):
+        raise LayoutError(str(config[tipo]))
+
+    template = config[tipo]["template"]
+    template_mtime = None
+    if template:
+        base_dir = os.path.dirname(os.path.abspath(config_path))
+        template_mtime = _mtime(os.path.join(base_dir, template))
+
+    layout = _compilar_layout(config_path, config_mtime, tipo, template_mtime)
+    if isinstance(layout, LayoutError):
+        raise LayoutError(str(layout))
+    return layout
+
 # -----------------------
 # PDF Extractor
 # -----------------------
@@ -68,11 +334,12 @@ class PDFExtractor:
         except Exception:
             return False
 
-    def extrair_tabelas(self):
+    def extrair_tabelas(self, layout=None):
         """
         Retorna BytesIO com Excel (openpyxl-saved) ou None em caso de falha.
         """
         try:
+            layout = layout or carregar_layout("excel")
             if not self._validate_pdf_magic_number():
                 return None
 
@@ -103,10 +370,7 @@ class PDFExtractor:
                 return None
 
             dfs = []
-            new_column_titles = [
-                '  ', 'Proposição', 'Autoria', 'Regime', 'Descrição',
-                'Relator', 'Solicitações de Pauta', 'Assessor', 'Orientação', 'Observações'
-            ]
+            new_column_titles = layout.colunas
 
             for i, tabela in enumerate(tabelas):
                 df = tabela.df
@@ -143,58 +407,45 @@ class PDFExtractor:
                         df_final[m_col] = ''
                     df_final = df_final[new_column_titles]
 
-            # Save to BytesIO via a temp file (openpyxl loads more reliably from path)
-            temp_excel_path = "temp_excel_output.xlsx"
-            df_final.to_excel(temp_excel_path, sheet_name="Tabelas", index=False, header=True)
-
-            workbook = openpyxl.load_workbook(temp_excel_path)
-            sheet = workbook["Tabelas"]
-            font = Font(name='Arial', size=14)
-            bold_font = Font(name='Arial', size=14, bold=True)
-            light_grey_fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
-            sheet.insert_rows(idx=1,amount=1)
-            sheet["A1"] = f"REUNIÃO DE LÍDERES - {data1}"
-
-            for row in sheet.iter_rows():
-                for cell in row:
-                    if cell.row <= 2:
-                        cell.font = bold_font
-                        cell.fill = light_grey_fill
-                        cell.alignment = Alignment(wrapText=True, horizontal='center', vertical='center')
+            # Preenche direto a planilha (ou o template) usando os estilos nomeados do layout
+            workbook, sheet = layout.novo_workbook()
+            linhas = [[layout.titulo.format(data=data1)], list(df_final.columns)]
+            linhas += df_final.values.tolist()
+            num_columns_in_excel = len(df_final.columns)
+            max_lengths = [0] * num_columns_in_excel
+
+            for row_idx, valores in enumerate(linhas, start=1):
+                for col_idx in range(1, num_columns_in_excel + 1):
+                    valor = valores[col_idx - 1] if col_idx <= len(valores) else None
+                    if valor == '':
+                        valor = None
+                    cell = sheet.cell(row=row_idx, column=col_idx, value=valor)
+                    if row_idx <= 2:
+                        cell.style = layout.ESTILO_CABECALHO
+                    elif col_idx == 1:
+                        cell.style = layout.ESTILO_PRIMEIRA_COLUNA
                     else:
-                        cell.font = font
-                        cell.alignment = Alignment(wrapText=True, horizontal='left', vertical='top')
-
-            if sheet.max_column >= 1:
-                for cell in sheet['A']:
-                    cell.fill = light_grey_fill
-
-            for col in sheet.columns:
-                max_length = 0
-                for cell in col:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                col_letter = col[0].column_letter
-                sheet.column_dimensions[col_letter].width = min(max_length * 1.2, 80)
-
-            num_columns_in_excel = sheet.max_column
+                        cell.style = layout.ESTILO_CORPO
+                    if valor:
+                        max_lengths[col_idx - 1] = max(max_lengths[col_idx - 1], len(str(valor)))
+
+            for col_idx, max_length in enumerate(max_lengths, start=1):
+                col_letter = get_column_letter(col_idx)
+                sheet.column_dimensions[col_letter].width = min(max_length * 1.2, layout.largura_maxima)
+
             if num_columns_in_excel >= 1:
-                for i in range(1, 10):
+                for i in range(1, min(layout.qtd_ultimas, num_columns_in_excel) + 1):
                     col_index_from_end = num_columns_in_excel - i
                     col_letter = get_column_letter(col_index_from_end + 1)
-                    sheet.column_dimensions[col_letter].width = 18  # Specific width for the last five columns
-                    sheet.column_dimensions['E'].width = 70
-                    sheet.column_dimensions['A'].width = 5
-                    sheet.row_dimensions[1].height = 30
+                    sheet.column_dimensions[col_letter].width = layout.largura_ultimas  # Specific width for the last columns
+                for col_letter, largura in layout.larguras.items():
+                    sheet.column_dimensions[col_letter].width = largura
+                sheet.row_dimensions[1].height = layout.altura_titulo
 
             sheet.merge_cells(start_row=1, start_column=1,end_row=1,end_column=sheet.max_column)
             output_final = BytesIO()
             workbook.save(output_final)
             output_final.seek(0)
-            try:
-                os.remove(temp_excel_path)
-            except Exception:
-                pass
             return output_final
 
         except Exception as e:
@@ -209,16 +460,12 @@ class PDFExtractor:
             if not self._validate_pdf_magic_number():
                 return []
 
-            # read bytes from start
+            # read bytes from start; pdfplumber lê direto da memória, sem arquivo temporário
             self.pdf_file.seek(0)
             pdf_bytes = self.pdf_file.read()
 
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
-                temp_pdf.write(pdf_bytes)
-                temp_path = temp_pdf.name
-
             texto_total = ""
-            with pdfplumber.open(temp_path) as pdf:
+            with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
                 for pagina in pdf.pages:
                     try:
                         texto = pagina.extract_text()
@@ -230,11 +477,6 @@ class PDFExtractor:
                         break
                     texto_total += "\n" + texto
 
-            try:
-                os.remove(temp_path)
-            except Exception:
-                pass
-
             linhas = [linha.strip() for linha in texto_total.split("\n")]
             linhas = [linha for linha in linhas if linha or re.fullmatch(r"^\d+\.?$", linha.strip())]
 
@@ -292,53 +534,76 @@ class DocumentGenerator:
             base_path = os.path.abspath(".")
         return os.path.join(base_path, relative_path)
 
-    def gerar_word_com_blocos(self, blocos):
+    @staticmethod
+    def _aplicar_bordas(tabela):
+        """ Bordas simples equivalentes ao "Table Grid", para templates que não têm esse estilo."""
+        bordas = OxmlElement("w:tblBorders")
+        for lado in ("top", "left", "bottom", "right", "insideH", "insideV"):
+            borda = OxmlElement(f"w:{lado}")
+            borda.set(qn("w:val"), "single")
+            borda.set(qn("w:sz"), "4")
+            borda.set(qn("w:space"), "0")
+            borda.set(qn("w:color"), "auto")
+            bordas.append(borda)
+        tbl_pr = tabela._tbl.tblPr
+        tbl_look = tbl_pr.find(qn("w:tblLook"))
+        if tbl_look is not None:
+            tbl_look.addprevious(bordas)
+        else:
+            tbl_pr.append(bordas)
+
+    def gerar_word_com_blocos(self, blocos, layout=None):
         image_path1 = resource_path("images/Oposicao.png")
         image_path2 = resource_path("images/lideranca.png")
 
         try:
-            doc = Document()
+            layout = layout or carregar_layout("word")
+            doc = layout.novo_documento()
             section = doc.sections[0]
             original_width, original_height = section.page_width, section.page_height
             section.orientation = WD_ORIENTATION.LANDSCAPE
-            section.page_width = original_height
-            section.page_height = original_width
+            if original_width < original_height:  # templates podem já vir em paisagem
+                section.page_width = original_height
+                section.page_height = original_width
             header = section.header
             paragraph = header.add_paragraph()
             heading = paragraph.add_run()
             #heading.add_picture(image_path1, width=Pt(80), height=Pt(80)) # Inserindo a image no Cabeçalho
-            heading = paragraph.add_run(f'      PAUTA DE PLENÁRIO - {data1}      ')
+            heading = paragraph.add_run(f'      {layout.titulo.format(data=data1)}      ')
             #heading.add_picture(image_path2, width=Pt(80), height=Pt(80)) # Inserindo a image no Cabeçalho
             custom = heading.font
-            custom.name = "Arial"
-            custom.size = Pt(13)
+            custom.name = layout.fonte
+            custom.size = layout.tamanho_titulo
             custom.bold = True
-            custom.color.rgb = RGBColor(0x00, 0x00, 0xFF)
+            custom.color.rgb = layout.cor_titulo
 
-            tabela = doc.add_table(rows=1, cols=2)
-            tabela.style = "Table Grid"
+            tabela = doc.add_table(rows=1, cols=len(layout.cabecalhos))
+            if layout.usar_estilo_tabela:
+                tabela.style = layout.ESTILO_TABELA
+            else:
+                self._aplicar_bordas(tabela)
             hdr_cells = tabela.rows[0].cells
             hdr_cells[0].width = Inches(-6)
-            hdr_cells[0].text = "Projeto"
-            hdr_cells[1].text = "Análise"
+            for cell, cabecalho in zip(hdr_cells, layout.cabecalhos):
+                cell.text = cabecalho
 
-            texto_complementa = "Autoria: \nRelatoria: \nAssessoria Oposição: \nMinoria: \nPOSICIONAMENTO:"
+            texto_complementa = layout.texto_complementa
 
             for cell in hdr_cells:
                 shading_elm = OxmlElement("w:shd")
-                shading_elm.set(qn("w:fill"), "D3D3D3")
+                shading_elm.set(qn("w:fill"), layout.cor_cabecalho)
                 cell._tc.get_or_add_tcPr().append(shading_elm)
                 for run in cell.paragraphs[0].runs:
                     run.font.bold = True
-                    run.font.size = Pt(13)
+                    run.font.size = layout.tamanho_cabecalho
 
             for numero, texto in blocos:
                 row_cells = tabela.add_row().cells
                 row_cells[0].text = f"{numero}. {texto}\n {texto_complementa}"
                 for c in row_cells:
                     for run in c.paragraphs[0].runs:
-                        run.font.size = Pt(10)
-                        run.font.name = "Arial"
+                        run.font.size = layout.tamanho_texto
+                        run.font.name = layout.fonte
 
             output = BytesIO()
             doc.save(output)
@@ -348,50 +613,174 @@ class DocumentGenerator:
             print(f"Erro ao gerar documento Word: {e}")
             return None
 
+# -----------------------
+# Pipeline stages
+# -----------------------
+def ler_pdf(pdf_path):
+    """ Etapa de I/O: lê o PDF inteiro do disco."""
+    with open(pdf_path, "rb") as f:
+        return f.read()
+
+
+def processar_pdf_bytes(pdf_bytes, output_type, pdf_path=None):
+    """
+    Etapa de CPU: extrai os dados do PDF e renderiza o Excel/Word.
+    Retorna (BytesIO, nome_sugerido) ou lança ValueError com a mensagem para o usuário.
+    """
+    pdf_file = BytesIO(pdf_bytes)
+    # camelot só aceita caminho de arquivo (abre o PDF por conta própria), então no Excel
+    # a leitura do original acontece aqui e não se sobrepõe à etapa de leitura. Com .name
+    # ao menos se evita gravar uma cópia temporária. O Word usa só os bytes em memória.
+    pdf_file.name = pdf_path
+    extractor = PDFExtractor(pdf_file)
+    if not extractor._validate_pdf_magic_number():
+        raise ValueError("Arquivo inválido (não parece ser um PDF).")
+
+    layout = carregar_layout(output_type)
+    if output_type == "excel":
+        excel_io = extractor.extrair_tabelas(layout)
+        if not excel_io:
+            raise ValueError("Nenhuma tabela encontrada ou falha na extração.")
+        return excel_io, layout.nome_arquivo.format(data=data)
+
+    blocos = extractor.extrair_blocos_por_numeros(stop_word="AVISO")
+    if not blocos:
+        raise ValueError("Nenhum bloco numerado encontrado.")
+    gen = DocumentGenerator()
+    word_io = gen.gerar_word_com_blocos(blocos, layout)
+    if not word_io:
+        raise ValueError("Falha ao gerar o documento Word.")
+    return word_io, layout.nome_arquivo.format(data=data)
+
+
+def salvar_arquivo(output_path, bytes_io):
+    """ Etapa de I/O: grava o resultado no disco."""
+    with open(output_path, "wb") as f:
+        f.write(bytes_io.getvalue())
+
 # -----------------------
 # Worker Thread
 # -----------------------
 class ProcessWorker(QThread):
     finished_signal = pyqtSignal(object, str, str)  # BytesIO, suggested_name, type
     error_signal = pyqtSignal(str)
+    progress_signal = pyqtSignal(int, int)  # concluídos, total
+    batch_finished_signal = pyqtSignal(list, list)  # arquivos salvos, erros
+
+    # Tamanho máximo das filas entre as etapas (limita a memória em lotes grandes)
+    QUEUE_SIZE = 2
 
-    def __init__(self, pdf_path, output_type):
+    def __init__(self, pdf_paths, output_type, output_dir=None):
         super().__init__()
-        self.pdf_path = pdf_path
+        if isinstance(pdf_paths, str):
+            pdf_paths = [pdf_paths]
+        self.pdf_paths = list(pdf_paths)
         self.output_type = output_type  # 'excel' or 'word'
+        # Sem output_dir (um único arquivo) o resultado volta para a GUI salvar;
+        # com output_dir (lote) a própria pipeline grava os arquivos.
+        self.output_dir = output_dir
+        self._salvos = []
+        self._erros = []
+        self._nomes_usados = set()
 
     def run(self):
         try:
-            # Open file in worker thread (independent file object)
-            with open(self.pdf_path, "rb") as f:
-                extractor = PDFExtractor(f)
-                # validate
-                if not extractor._validate_pdf_magic_number():
-                    self.error_signal.emit("Arquivo inválido (não parece ser um PDF).")
-                    return
-
-                if self.output_type == "excel":
-                    excel_io = extractor.extrair_tabelas()
-                    if not excel_io:
-                        self.error_signal.emit("Nenhuma tabela encontrada ou falha na extração.")
-                        return
-                    suggested = f"{data} - REUNIÃO DE LÍDERES.xlsx"
-                    self.finished_signal.emit(excel_io, suggested, "excel")
-                else:
-                    blocos = extractor.extrair_blocos_por_numeros(stop_word="AVISO")
-                    if not blocos:
-                        self.error_signal.emit("Nenhum bloco numerado encontrado.")
-                        return
-                    gen = DocumentGenerator()
-                    word_io = gen.gerar_word_com_blocos(blocos)
-                    if not word_io:
-                        self.error_signal.emit("Falha ao gerar o documento Word.")
-                        return
-                    suggested = f"{data} - Pauta plenário.docx"
-                    self.finished_signal.emit(word_io, suggested, "word")
+            asyncio.run(self._pipeline())
         except Exception as e:
             tb = traceback.format_exc()
             self.error_signal.emit(f"Erro durante processamento: {e}\n{tb}")
+            return
+
+        if self.output_dir is not None:
+            self.batch_finished_signal.emit(self._salvos, self._erros)
+
+    # -----------------------
+    # Pipeline assíncrona: leitura -> processamento -> escrita
+    # -----------------------
+    async def _pipeline(self):
+        fila_processamento = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        fila_escrita = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+
+        # Um único worker de CPU: extração e renderização são Python puro e disputam o GIL,
+        # então mais threads não aceleram e só aumentariam a memória em uso
+        with ThreadPoolExecutor(max_workers=1) as cpu_executor:
+            await asyncio.gather(
+                self._etapa_leitura(fila_processamento),
+                self._etapa_processamento(fila_processamento, fila_escrita, cpu_executor),
+                self._etapa_escrita(fila_escrita),
+            )
+
+    async def _etapa_leitura(self, fila_saida):
+        for pdf_path in self.pdf_paths:
+            try:
+                pdf_bytes = await asyncio.to_thread(ler_pdf, pdf_path)
+                await fila_saida.put((pdf_path, pdf_bytes, None))
+            except Exception as e:
+                await fila_saida.put((pdf_path, None, f"Falha ao ler o arquivo: {e}"))
+        await fila_saida.put(None)
+
+    async def _etapa_processamento(self, fila_entrada, fila_saida, executor):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await fila_entrada.get()
+            if item is None:
+                break
+            pdf_path, pdf_bytes, erro = item
+            resultado = None
+            if erro is None:
+                try:
+                    resultado = await loop.run_in_executor(
+                        executor, processar_pdf_bytes, pdf_bytes, self.output_type, pdf_path
+                    )
+                except ValueError as e:
+                    erro = str(e)
+                except Exception as e:
+                    erro = f"Erro durante processamento: {e}\n{traceback.format_exc()}"
+            await fila_saida.put((pdf_path, resultado, erro))
+        await fila_saida.put(None)
+
+    async def _etapa_escrita(self, fila_entrada):
+        concluidos = 0
+        total = len(self.pdf_paths)
+        while True:
+            item = await fila_entrada.get()
+            if item is None:
+                break
+            pdf_path, resultado, erro = item
+            concluidos += 1
+
+            if self.output_dir is None:
+                # Modo de arquivo único: a GUI pergunta onde salvar
+                if erro is not None:
+                    self.error_signal.emit(erro)
+                else:
+                    bytes_io, suggested = resultado
+                    self.finished_signal.emit(bytes_io, suggested, self.output_type)
+                continue
+
+            if erro is None:
+                bytes_io, suggested = resultado
+                output_path = self._caminho_saida(pdf_path, suggested)
+                try:
+                    await asyncio.to_thread(salvar_arquivo, output_path, bytes_io)
+                    self._salvos.append(output_path)
+                except Exception as e:
+                    erro = f"Não foi possível salvar o arquivo: {e}"
+            if erro is not None:
+                self._erros.append(f"{os.path.basename(pdf_path)}: {erro}")
+            self.progress_signal.emit(concluidos, total)
+
+    def _caminho_saida(self, pdf_path, suggested):
+        # PDFs de mesmo nome vindos de pastas diferentes não podem sobrescrever um ao outro
+        nome_pdf = os.path.splitext(os.path.basename(pdf_path))[0]
+        nome = f"{nome_pdf} - {suggested}"
+        contador = 2
+        # Também não sobrescreve arquivos que já existem na pasta escolhida
+        while nome.lower() in self._nomes_usados or os.path.exists(os.path.join(self.output_dir, nome)):
+            nome = f"{nome_pdf} ({contador}) - {suggested}"
+            contador += 1
+        self._nomes_usados.add(nome.lower())
+        return os.path.join(self.output_dir, nome)
 
 
 # -----------------------
@@ -415,7 +804,7 @@ class PDFApp(QWidget):
 
         # input editable
         self.file_input = QLineEdit()
-        self.file_input.setPlaceholderText("Digite ou cole o caminho do PDF ou clique em 'Procurar'...")
+        self.file_input.setPlaceholderText("Digite ou cole o caminho do PDF (vários separados por ';') ou clique em 'Procurar'...")
         self.file_input.setStyleSheet("font: 12pt Arial;")
         layout.addWidget(self.file_input)
 
@@ -465,13 +854,13 @@ class PDFApp(QWidget):
     # -----------------------
 
     def selecionar_pdf(self):
-        pdf_path, _ = QFileDialog.getOpenFileName(self, "Selecionar PDF", "", "PDF Files (*.pdf)")
-        if pdf_path:
-            self.file_input.setText(pdf_path)
+        pdf_paths, _ = QFileDialog.getOpenFileNames(self, "Selecionar PDF", "", "PDF Files (*.pdf)")
+        if pdf_paths:
+            self.file_input.setText("; ".join(pdf_paths))
 
 
-    def get_pdf_path(self):
-        return self.file_input.text().strip()
+    def get_pdf_paths(self):
+        return [p.strip() for p in self.file_input.text().split(";") if p.strip()]
 
 
     def set_ui_enabled(self, enabled: bool):
@@ -608,6 +997,30 @@ class PDFApp(QWidget):
                 pass
             self.worker = None
 
+    def on_worker_progress(self, concluidos, total):
+        self.progress.setValue(20 + int(80 * concluidos / total))
+        self.status.setText(f"🔄 Processados {concluidos} de {total} arquivos...")
+
+    def on_batch_finished(self, salvos, erros):
+        self.set_ui_enabled(True)
+        try:
+            if self.worker:
+                self.worker.quit()
+                self.worker.wait(100)
+        except Exception:
+            pass
+        self.worker = None
+
+        if erros:
+            self.animate_progress(self.progress.value(), 0)
+            self.status.setText(f"⚠ {len(salvos)} arquivo(s) salvo(s), {len(erros)} com erro")
+            QMessageBox.warning(self, "Erro", "Alguns arquivos não foram processados:\n\n" + "\n".join(erros))
+            return
+
+        self.progress.setValue(100)
+        self.status.setText(f"✅ {len(salvos)} arquivo(s) salvo(s) com sucesso!")
+        QTimer.singleShot(2000, self.reset_progress_after_delay)
+
     def on_worker_error(self, message):
         # Para Animação
         try:
@@ -634,12 +1047,19 @@ class PDFApp(QWidget):
     # Main action
     # -----------------------
     def processar_pdf(self):
-        pdf_path = self.get_pdf_path()
-        if not pdf_path or not os.path.exists(pdf_path):
+        pdf_paths = self.get_pdf_paths()
+        if not pdf_paths or not all(os.path.exists(p) for p in pdf_paths):
             QMessageBox.warning(self, "Erro", "Digite ou selecione um PDF válido!")
             #self.registrar_log("Arquivo PDF inválido ou não encontrado.")
             return
 
+        # Em lote, os arquivos são gravados direto na pasta escolhida
+        output_dir = None
+        if len(pdf_paths) > 1:
+            output_dir = QFileDialog.getExistingDirectory(self, "Selecionar pasta de destino")
+            if not output_dir:
+                return
+
         # Desativar a UI durante a execução
         self.set_ui_enabled(False)
         self.status.setText("🔄 Iniciando processamento...")
@@ -649,9 +1069,11 @@ class PDFApp(QWidget):
         out_type = "excel" if self.option_excel.isChecked() else "word"
 
         # Create and start worker
-        self.worker = ProcessWorker(pdf_path, out_type)
+        self.worker = ProcessWorker(pdf_paths, out_type, output_dir)
         self.worker.finished_signal.connect(self.on_worker_finished)
         self.worker.error_signal.connect(self.on_worker_error)
+        self.worker.progress_signal.connect(self.on_worker_progress)
+        self.worker.batch_finished_signal.connect(self.on_batch_finished)
         self.worker.start()
 
 # -----------------------